@@ -28,6 +28,28 @@ def _regexfy(patt, root=None):
     return re.compile(r"^/" + str(patt) + r".*")
 
 
+def _compile_patterns(patterns, root=None):
+    """Compile a list of path patterns, merging string patterns into one.
+
+    Patterns passed in as compiled regular expressions are kept as-is, since
+    they may carry their own anchors and flags. All string patterns are
+    combined into a single alternation, so that each path is scanned once
+    rather than once per pattern.
+    """
+    compiled = [patt for patt in patterns if hasattr(patt, "search")]
+    fragments = []
+    for patt in patterns:
+        if hasattr(patt, "search"):
+            continue
+        patt = Path(patt)
+        if patt.is_absolute():
+            patt = patt.relative_to(root or "/")
+        fragments.append("(?:{})".format(patt))
+    if fragments:
+        compiled.append(re.compile(r"^/(?:" + "|".join(fragments) + r").*"))
+    return compiled
+
+
 def _extract_entities(bidsfile, entities):
     match_vals = {}
     for e in entities.values():
@@ -138,12 +160,10 @@ class BIDSLayoutIndexer:
                                                self._layout._root)
 
         # Do not accept string patterns
-        self._include_patterns = [
-            _regexfy(patt, root=self._layout._root) for patt in listify(force)
-        ]
-        self._exclude_patterns = [
-            _regexfy(patt, root=self._layout._root) for patt in listify(ignore)
-        ]
+        self._include_patterns = _compile_patterns(
+            listify(force), root=self._layout._root)
+        self._exclude_patterns = _compile_patterns(
+            listify(ignore), root=self._layout._root)
 
         all_bfs, all_tag_dicts = self._index_dir(self._layout._root, self._config)
 
@@ -179,6 +199,10 @@ class BIDSLayoutIndexer:
         to_check = Path('/') / to_check
         # bids-validator works with posix paths only
         to_check = to_check.as_posix()
+        # Hidden files and directories can never validate; reject them
+        # before paying for the validator's full regex battery
+        if '/.' in to_check:
+            return False
         return self.validator.is_bids(to_check)
 
     def _index_dir(self, path, config, force=None):
@@ -133,10 +133,9 @@ class BIDSLayout:
 
         # Validate that a valid BIDS project exists at root
         root, description = validate_root(root, validate)
-        if any([
-            is_derivative,
+        if is_derivative or (
             description and description.get("DatasetType") == "derivative"
-        ]):
+        ):
             try:
                 self.source_pipeline = validate_derivative_path(root)
             except (BIDSValidationError, FileNotFoundError) as err:
@@ -260,10 +259,11 @@ class BIDSLayout:
         # defined pipeline name, or is applying the 'derivatives' rules.
         pl_name = self.source_pipeline
 
-        return any([
-            'raw' in scope and not self.is_derivative,
-            ('derivatives' in scope or pl_name in scope) and self.is_derivative
-        ])
+        return (
+            ('raw' in scope and not self.is_derivative)
+            or (('derivatives' in scope or pl_name in scope)
+                and self.is_derivative)
+        )
 
     def _get_layouts_in_scope(self, scope):
         """Return all layouts in the passed scope."""
@@ -584,6 +584,17 @@ class BIDSLayout:
         for o in orphans:
             data.loc[o] = pd.Series(dtype=float)
 
+        # Entity values are low-cardinality strings, so dictionary-encode
+        # them rather than storing one Python object per cell. Metadata
+        # values may be unhashable (e.g., SliceTiming lists); leave any
+        # column that can't be encoded as-is.
+        for col in data.columns:
+            if data[col].dtype == object:
+                try:
+                    data[col] = data[col].astype('category')
+                except TypeError:
+                    pass
+
         return data.reset_index()
     def get(self, return_type='object', target=None, scope='all',
             regex_search=False, absolute_paths=None, invalid_filters='error',
@@ -1136,7 +1147,7 @@ class BIDSLayout:
                 intended_for = listify(metadata["IntendedFor"])
                 # path uses local os separators while _suff read from json likely uses author's os separators, so we
                 # convert _suff to use local separators.
-                if any([path.endswith(str(Path(_suff))) for _suff in intended_for]):
+                if any(path.endswith(str(Path(_suff))) for _suff in intended_for):
                     cur_fieldmap = {}
                     if file.entities['suffix'] == "phasediff":
                         cur_fieldmap = {"phasediff": file.path,
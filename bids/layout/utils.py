@@ -1,4 +1,6 @@
 """Miscellaneous layout-related utilities."""
+from functools import lru_cache
+
 from upath import UPath as Path
 
 from .. import config as cf
@@ -6,6 +8,18 @@ from ..utils import make_bidsfile, listify
 from ..exceptions import ConfigError
 
 
+@lru_cache()
+def _load_config(config):
+    """Load a named Config exactly once.
+
+    Loading a Config from scratch parses its JSON file and compiles a
+    regex for every entity, which is far too expensive to repeat on each
+    parse_file_entities call.
+    """
+    from .models import Config
+    return Config.load(config)
+
+
 class BIDSMetadata(dict):
     """ Metadata dictionary that reports the associated file on lookup failures. """
     def __init__(self, source_file):
@@ -122,7 +136,9 @@ def parse_file_entities(filename, entities=None, config=None,
             config = ['bids', 'derivatives']
 
         from .models import Config
-        config = [Config.load(c) if not isinstance(c, Config) else c
+        config = [c if isinstance(c, Config)
+                  else _load_config(c) if isinstance(c, str)
+                  else Config.load(c)
                   for c in listify(config)]
 
         # Consolidate entities from all Configs into a single dict
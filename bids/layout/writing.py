@@ -14,6 +14,9 @@ from upath import UPath as Path
 __all__ = ['build_path', 'write_to_file']
 
 _PATTERN_FIND = re.compile(r'({([\w\d]*?)(?:<([^>]+)>)?(?:\|((?:\.?[\w])+))?\})')
+_PATTERN_EXT_DOT = re.compile(r'\.\{extension')
+_PATTERN_OPTIONAL = re.compile(r'(\[.*?\])')
+_PATTERN_OPTIONS = re.compile(r'\[(.*?)\]')
 
 
 def build_path(entities, path_patterns, strict=False):
@@ -147,7 +150,7 @@ def build_path(entities, path_patterns, strict=False):
         if 'extension' in tmp_entities:
             exts = [e.lstrip('.') for e in tmp_entities['extension']]
             # Does this pattern place a dot before the extension, or expect it inside?
-            if re.search(r'\.\{extension', pattern):
+            if _PATTERN_EXT_DOT.search(pattern):
                 tmp_entities['extension'] = exts
             else:
                 tmp_entities['extension'] = ['.' + e for e in exts]
@@ -173,7 +176,7 @@ def build_path(entities, path_patterns, strict=False):
             # At this point, valid & default values are checked & set - simplify pattern
             new_path = new_path.replace(fmt, '{%s}' % name)
 
-        optional_patterns = re.findall(r'(\[.*?\])', new_path)
+        optional_patterns = _PATTERN_OPTIONAL.findall(new_path)
         # Optional patterns with selector are cast to mandatory or removed
         for op in optional_patterns:
             for ent_name in {k for k, v in entities.items() if v is not None}:
@@ -304,11 +307,11 @@ def _expand_options(value):
     ['json']
 
     """
-    expand_patterns = re.findall(r'\[(.*?)\]', value)
+    expand_patterns = _PATTERN_OPTIONS.findall(value)
     if not expand_patterns:
         return [value]
 
-    value = re.sub(r'\[(.*?)\]', '%s', value)
+    value = _PATTERN_OPTIONS.sub('%s', value)
     return [value % _r for _r in product(*expand_patterns)]
 
 
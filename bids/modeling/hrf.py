@@ -7,6 +7,8 @@ Author: Bertrand Thirion, 2011--2015
 """
 
 import warnings
+from functools import lru_cache
+
 import numpy as np
 
 
@@ -363,7 +365,21 @@ def _hrf_kernel(hrf_model, tr, oversampling=50, fir_delays=None):
     -------
     hkernel : list of arrays
         samples of the hrf (the number depends on the hrf_model used)
+
+    Notes
+    -----
+    Kernels are cached on (hrf_model, tr, oversampling, fir_delays), since
+    collections routinely convolve dozens of variables with identical
+    parameters and rebuilding the gamma-function bases dominates the cost.
     """
+    if fir_delays is not None:
+        fir_delays = tuple(fir_delays)
+    return list(_hrf_kernel_cached(hrf_model, float(tr), oversampling,
+                                   fir_delays))
+
+
+@lru_cache(maxsize=32)
+def _hrf_kernel_cached(hrf_model, tr, oversampling, fir_delays):
     acceptable_hrfs = [
         'spm', 'spm + derivative', 'spm + derivative + dispersion', 'fir',
         'glover', 'glover + derivative', 'glover + derivative + dispersion',
@@ -458,9 +474,17 @@ def compute_regressor(exp_condition, hrf_model, frame_times, con_id='cond',
     # 2. create the hrf model(s)
     hkernel = _hrf_kernel(hrf_model, tr, oversampling, fir_delays)
 
-    # 3. convolve the regressor and hrf, and downsample the regressor
-    conv_reg = np.array([np.convolve(hr_regressor, h)[:hr_regressor.size]
-                         for h in hkernel])
+    # 3. convolve the regressor and hrf, and downsample the regressor.
+    # All kernels are convolved in a single batched FFT pass; shorter
+    # kernels (e.g. individual FIR delays) are zero-padded on the right,
+    # which does not change the truncated result.
+    from scipy.signal import fftconvolve
+    klen = max(h.size for h in hkernel)
+    kernels = np.zeros((klen, len(hkernel)))
+    for i, h in enumerate(hkernel):
+        kernels[:h.size, i] = h
+    conv_reg = fftconvolve(hr_regressor[:, np.newaxis], kernels, mode='full',
+                           axes=0)[:hr_regressor.size].T
 
     # 4. temporally resample the regressors
     computed_regressors = _resample_regressor(
@@ -98,6 +98,13 @@ class Transformation(metaclass=ABCMeta):
     # every input variable.
     _sync_kwargs = True
 
+    # Boolean indicating whether the per-variable _transform() calls may be
+    # dispatched to a thread pool when several variables are processed with
+    # identical arguments. Only worthwhile for transformations that spend
+    # most of their time in numpy/scipy routines that release the GIL
+    # (e.g., Convolve); defaults to False.
+    _parallel = False
+
     def __new__(cls, collection, variables, *args, **kwargs):
         t = super(Transformation, cls).__new__(cls)
         t._setup(collection, variables, *args, **kwargs)
@@ -270,6 +277,17 @@ class Transformation(metaclass=ABCMeta):
         if not self._loopable:
             variables = [variables]
 
+        # Transformations that opt in via _parallel fan their per-variable
+        # work out to a thread pool; results are collected in order and the
+        # bookkeeping below stays sequential.
+        par_results = None
+        if (self._parallel and self._loopable and not self._sync_kwargs
+                and self.groupby is None and len(variables) > 1):
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor() as executor:
+                par_results = list(executor.map(
+                    lambda d: self._transform(d, **kwargs), data))
+
         i_kwargs = kwargs
         for i, col in enumerate(variables):
             if self._sync_kwargs:
@@ -284,6 +302,8 @@ class Transformation(metaclass=ABCMeta):
                 if self._groupable and self.groupby is not None:
                     result = col.apply(self._transform, groupby=self.groupby,
                                        **i_kwargs)
+                elif par_results is not None:
+                    result = par_results[i]
                 else:
                     result = self._transform(data[i], **i_kwargs)
 
@@ -383,8 +403,8 @@ class Transformation(metaclass=ABCMeta):
 
                 # Compare 1st col with each of the others
                 fc = get_col_data(variables[0])
-                if not all([compare_variables(fc, get_col_data(c))
-                            for c in variables[1:]]):
+                if not all(compare_variables(fc, get_col_data(c))
+                           for c in variables[1:]):
                     if self._aligned_required == 'force_dense':
                         msg = ("Forcing all sparse variables to dense in "
                                "order to ensure proper alignment.")
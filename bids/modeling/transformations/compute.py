@@ -5,6 +5,7 @@ import math
 import numpy as np
 import pandas as pd
 from scipy import ndimage as ndi
+from scipy.linalg import qr, solve_triangular
 from bids.utils import listify
 from .base import Transformation
 from bids.modeling import hrf
@@ -43,6 +44,9 @@ class Convolve(Transformation):
     _input_type = 'variable'
     _return_type = 'variable'
     _sync_kwargs = False
+    # Each variable convolves independently, and the FFT work releases the
+    # GIL, so fan out across threads when several variables are passed
+    _parallel = True
 
     def _transform(self, var, model='spm', derivative=False, dispersion=False,
                    fir_delays=None):
@@ -124,14 +128,22 @@ class Orthogonalize(Transformation):
 
         other = listify(other)
 
-        # Set up X matrix and slice into it based on target variable indices
-        X = np.array([self._variables[c].values.values.squeeze()
-                      for c in other]).T
-        X = X[var.index, :]
+        # Assemble [1 | X] column by column, directly in the Fortran order
+        # LAPACK's QR wants; np.array(...).T followed by np.c_ would copy
+        # the data twice more and hand scipy a row-major array
+        n = len(var.index)
+        _aX = np.empty((n, len(other) + 1), order='F')
+        _aX[:, 0] = 1
+        for i, c in enumerate(other):
+            col = np.asarray(self._variables[c].values.values).ravel()
+            _aX[:, i + 1] = col[var.index]
+        X = _aX[:, 1:]
         assert len(X) == len(var)
-        y = var.values
-        _aX = np.c_[np.ones(len(y)), X]
-        coefs, resids, rank, s = np.linalg.lstsq(_aX, y, rcond=None)
+        y = np.asarray(var.values)
+        # We only need the coefficients, so a QR solve is considerably
+        # cheaper than the SVD-based lstsq for tall, full-rank matrices
+        Q, R = qr(_aX, mode='economic')
+        coefs = solve_triangular(R, Q.T @ y)
         result = pd.DataFrame(y - X.dot(coefs[1:]), index=var.index)
         return result
 
@@ -144,8 +156,16 @@ class Product(Transformation):
     _output_required = True
 
     def _transform(self, data):
-        data = pd.concat(data, axis=1, sort=True)
-        return data.product(1)
+        # Fold the elementwise product in place rather than materializing a
+        # concatenated (n, N) frame and reducing it; NaNs are mapped to 1
+        # to match pandas' NaN-skipping product()
+        it = iter(data)
+        first = np.asarray(next(it), dtype=np.float64).ravel()
+        out = np.where(np.isnan(first), 1., first)
+        for d in it:
+            arr = np.asarray(d, dtype=np.float64).ravel()
+            np.multiply(out, np.where(np.isnan(arr), 1., arr), out=out)
+        return pd.Series(out, index=data[0].index)
 
 
 class Scale(Transformation):
@@ -177,15 +197,22 @@ class Scale(Transformation):
             raise ValueError("Cannot scale a column with constant value ({})! "
                              "If you want a constant column of 0's returned, "
                              "set replace_na to 'after'.".format(val))
+        # Operate on a float ndarray copy; each pandas reduction rebuilds a
+        # NaN mask and rescans the data, and in-place ops on the input can
+        # trigger upcasting and copy-on-write overhead.
+        vals = data.to_numpy(dtype=np.float64, copy=True)
         if replace_na == 'before':
-            data = data.fillna(0.)
-        if demean:
-            data -= data.mean()
-        if rescale:
-            data /= data.std()
+            vals[np.isnan(vals)] = 0.
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if demean:
+                vals -= np.nanmean(vals, axis=0)
+            if rescale:
+                vals /= np.nanstd(vals, axis=0, ddof=1)
         if replace_na == 'after':
-            data = data.fillna(0.)
-        return data
+            vals[np.isnan(vals)] = 0.
+        if isinstance(data, pd.DataFrame):
+            return pd.DataFrame(vals, index=data.index, columns=data.columns)
+        return pd.Series(vals, index=data.index, name=data.name)
 
 
 class Sum(Transformation):
@@ -206,7 +233,13 @@ class Sum(Transformation):
                 raise ValueError("If weights are passed to sum(), the number "
                                  "of elements must equal number of variables"
                                  " being summed.")
-        return (data * weights).sum(axis=1)
+        vals = data.to_numpy(dtype=np.float64)
+        # pandas' sum treats NaN as 0; zero-fill so the BLAS matrix-vector
+        # product below preserves that behavior
+        mask = np.isnan(vals)
+        if mask.any():
+            vals = np.where(mask, 0., vals)
+        return pd.Series(vals @ weights.ravel(), index=data.index)
 
 
 class Threshold(Transformation):
@@ -239,14 +272,21 @@ class Threshold(Transformation):
 
     def _transform(self, data, threshold=0., binarize=False, above=True,
                    signed=True):
+        # A single np.where pass avoids the boolean-mask temporaries and
+        # slow pandas boolean __setitem__ calls
+        vals = data.to_numpy(dtype=np.float64)
         if not signed:
             threshold = np.abs(threshold)
-            data = data.abs()
-        keep = data >= threshold if above else data <= threshold
-        data[~keep] = 0
+            vals = np.abs(vals)
+        keep = vals >= threshold if above else vals <= threshold
         if binarize:
-            data[keep] = 1
-        return data
+            # int8 is plenty for a 0/1 indicator and cuts memory 8-fold
+            out = keep.astype(np.int8)
+        else:
+            out = np.where(keep, vals, 0.)
+        if isinstance(data, pd.DataFrame):
+            return pd.DataFrame(out, index=data.index, columns=data.columns)
+        return pd.Series(out, index=data.index, name=data.name)
 
 
 class And_(Transformation):
@@ -265,8 +305,11 @@ class And_(Transformation):
     _sync_kwargs = False
 
     def _transform(self, dfs):
-        df = pd.concat(dfs, axis=1, sort=True)
-        return df.all(axis=1).astype(int)
+        # Inputs are aligned, so reduce directly over the underlying arrays
+        # instead of materializing a concatenated DataFrame
+        arrs = [np.asarray(df, dtype=bool).ravel() for df in dfs]
+        out = np.logical_and.reduce(arrs)
+        return pd.Series(out.astype(np.int8), index=dfs[0].index)
 
 
 class Not(Transformation):
@@ -302,8 +345,12 @@ class Or_(Transformation):
     sync_kwargs = False
 
     def _transform(self, dfs):
-        df = pd.concat(dfs, axis=1, sort=True)
-        return df.any(axis=1).astype(int)
+        # As in And_, reduce over the raw arrays; NaNs are zeroed first so
+        # they don't count as True, matching pandas' NaN-skipping any()
+        arrs = [np.nan_to_num(np.asarray(df, dtype=float)).astype(bool).ravel()
+                for df in dfs]
+        out = np.logical_or.reduce(arrs)
+        return pd.Series(out.astype(np.int8), index=dfs[0].index)
 
 
 class Lag(Transformation):
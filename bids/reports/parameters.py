@@ -208,11 +208,12 @@ def describe_intendedfor_targets(metadata: dict, layout) -> str:
         scans = metadata["IntendedFor"]
         run_dict = {}
 
+        # Query the index once rather than once per IntendedFor target
+        nii_files = layout.get(extension=[".nii", ".nii.gz"])
+
         for scan in scans:
             fn = op.basename(scan)
-            if_file = [
-                f for f in layout.get(extension=[".nii", ".nii.gz"]) if fn in f.path
-            ][0]
+            if_file = [f for f in nii_files if fn in f.path][0]
             run_num = int(if_file.run)
             target_type = if_file.entities["suffix"].upper()
 
@@ -96,14 +96,15 @@ def make_bidsfile(filename):
     """Create a BIDSFile instance of the appropriate class. """
     from .layout import models
 
-    # Extract all extensions from filename (a.tar.gz -> .tar.gz, not just .gz)
-    ext = ''.join(Path(filename).suffixes)
-
-    if ext.endswith(('.nii', '.nii.gz', '.gii')):
+    # Dispatch on the filename tail directly; this runs once per indexed
+    # file, and building a Path just to join its suffixes is far slower
+    # than a few prefix-compiled str.endswith checks
+    fname = str(filename)
+    if fname.endswith(('.nii', '.nii.gz', '.gii')):
         cls = 'BIDSImageFile'
-    elif ext in ['.tsv', '.tsv.gz']:
+    elif fname.endswith(('.tsv', '.tsv.gz')):
         cls = 'BIDSDataFile'
-    elif ext == '.json':
+    elif fname.endswith('.json'):
         cls = 'BIDSJSONFile'
     else:
         cls = 'BIDSFile'
@@ -103,6 +103,24 @@ class NodeIndex:
         super(NodeIndex, self).__init__()
         self.index = pd.DataFrame()
         self.nodes = []
+        self._pending_rows = []
+
+    def _flush_index(self):
+        """Fold any pending node rows into the index in a single concat.
+
+        Nodes are typically created in batches, so accumulating rows and
+        concatenating once is much cheaper than growing the index one row
+        at a time.
+        """
+        if not self._pending_rows:
+            return
+        new_rows = pd.DataFrame(self._pending_rows)
+        if self.index.empty:
+            self.index = new_rows.reset_index(drop=True)
+        else:
+            self.index = pd.concat([self.index, new_rows],
+                                   ignore_index=True)
+        self._pending_rows = []
 
     def get_collections(self, unit, names=None, merge=False,
                         sampling_rate=None, **entities):
@@ -187,6 +205,8 @@ class NodeIndex:
         A list of Node instances.
         """
 
+        self._flush_index()
+
         entities = {} if entities is None else entities.copy()
 
         if level is not None:
@@ -253,10 +273,9 @@ class NodeIndex:
         entities = dict(entities, node_index=len(self.nodes), level=level)
         self.nodes.append(node)
         # Because "entities" may have non-scalar values (such as `SliceTiming`)
-        # we need to first create a Series to avoid expansion
-        # From here we can concatenate
-        node_row = pd.DataFrame(pd.Series(entities)).T
-        self.index = pd.concat([self.index, node_row], ignore_index=True)
+        # we create a Series per node to avoid expansion; rows are folded
+        # into the index lazily, the next time it is queried
+        self._pending_rows.append(pd.Series(entities))
         return node
 
     def get_or_create_node(self, level, entities, *args, **kwargs):